@@ -20,6 +20,7 @@ history = open("CHANGES.rst").read()
 
 tests_require = [
     "pytest-reana>=0.8.0,<0.9.0",
+    "pytest-xdist>=2.0,<3.0",
 ]
 
 extras_require = {
@@ -10,10 +10,30 @@
 
 from __future__ import absolute_import, print_function
 
+from types import SimpleNamespace
+from unittest.mock import Mock
+
 import pytest
+import requests
+from click.testing import CliRunner
 
 
-@pytest.fixture()
+@pytest.fixture(autouse=True)
+def no_network_requests(monkeypatch):
+    """Prevent tests from sending real upload requests to a REANA server."""
+    http_response = SimpleNamespace(
+        status_code=200, ok=True, content=b"", headers={}, json=lambda: {}
+    )
+    monkeypatch.setattr(requests, "post", Mock(return_value=http_response))
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Return Click CLI runner shared by the tests of a module."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
 def create_yaml_workflow_schema() -> str:
     """Return dummy YAML workflow schema."""
     reana_yaml_schema = """
@@ -42,6 +62,15 @@ def create_yaml_workflow_schema() -> str:
     return reana_yaml_schema
 
 
+@pytest.fixture(scope="session")
+def prebuilt_reana_yaml(tmp_path_factory, create_yaml_workflow_schema: str):
+    """Return directory with dummy ``reana.yaml`` and ``file.txt`` files."""
+    workdir = tmp_path_factory.mktemp("reana_yaml")
+    (workdir / "reana.yaml").write_text(create_yaml_workflow_schema)
+    (workdir / "file.txt").write_text("test")
+    return workdir
+
+
 @pytest.fixture()
 def create_yaml_workflow_schema_with_workspace(create_yaml_workflow_schema: str) -> str:
     """Return dummy YAML workflow schema with `/var/reana` workspace."""
@@ -8,157 +8,253 @@
 
 """REANA client files tests."""
 
-import hashlib
 import json
 import os
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from click.testing import CliRunner
-from mock import Mock, patch
+import pytest
+import requests
 from pytest_reana.test_utils import make_mock_api_client
 
+import reana_client.api.client as _rc_api
 from reana_client.cli import cli
 
 
-def test_list_files_server_not_reachable():
+_LS_RESPONSE = {
+    "items": [
+        {
+            "last-modified": "string",
+            "name": "string",
+            "size": {"raw": 0, "human_readable": "0 Bytes"},
+        }
+    ]
+}
+
+_LS_FILTER_RESPONSE = {
+    "items": [
+        {
+            "last-modified": "2021-06-14T10:20:13",
+            "name": "data/names.txt",
+            "size": {"human_readable": "20 Bytes", "raw": 20},
+        },
+    ]
+}
+
+_LS_FILTER_WITH_FILENAME_RESPONSE = {
+    "items": [
+        {
+            "last-modified": "2021-06-14T10:20:14",
+            "name": "workflow/cwl/helloworld-slurmcern.cwl",
+            "size": {"human_readable": "965 Bytes", "raw": 965},
+        },
+        {
+            "last-modified": "2021-06-14T10:20:14",
+            "name": "workflow/cwl/helloworld-job.yml",
+            "size": {"human_readable": "122 Bytes", "raw": 122},
+        },
+        {
+            "last-modified": "2021-06-14T10:20:14",
+            "name": "workflow/cwl/helloworld.cwl",
+            "size": {"human_readable": "867 Bytes", "raw": 867},
+        },
+    ]
+}
+
+_DU_RESPONSE = {
+    "disk_usage_info": [
+        {
+            "name": "/merge/_packtivity",
+            "size": {"human_readable": "4 KiB", "raw": 4096},
+        }
+    ],
+    "user": "00000000-0000-0000-0000-000000000000",
+    "workflow_id": "7767678-766787",
+    "workflow_name": "workflow",
+}
+
+_DU_EMPTY_RESPONSE = {
+    "disk_usage_info": [],
+    "user": "00000000-0000-0000-0000-000000000000",
+    "workflow_id": "7767678-766787",
+    "workflow_name": "workflow",
+}
+
+
+@lru_cache(maxsize=None)
+def _template_client():
+    """Return a reana-server mock API client built once per module."""
+    return make_mock_api_client("reana-server")()
+
+
+def _mock_client(mock_response, mock_http_response):
+    """Return the template mock API client answering with the given responses."""
+    client = _template_client()
+    # Relies on pytest_reana's make_mock_api_client() building the bravado
+    # client on a Mock http client whose ``request().result()`` returns the
+    # ``(mock_response, mock_http_response)`` pair; a different structure
+    # makes ``reset_mock`` below fail.
+    http_client = client.swagger_spec.http_client
+    http_client.reset_mock(return_value=True, side_effect=True)
+    mock_result = Mock()
+    mock_result.result.return_value = (mock_response, mock_http_response)
+    http_client.request.return_value = mock_result
+    return client
+
+
+def patched_api(monkeypatch, mock_response, mock_http_response):
+    """Patch the reana-server API client with a mocked one."""
+    monkeypatch.setattr(
+        _rc_api,
+        "current_rs_api_client",
+        _mock_client(mock_response, mock_http_response),
+    )
+
+
+def test_list_files_server_not_reachable(runner):
     """Test list workflow workspace files when not connected to any cluster."""
     reana_token = "000000"
     message = "REANA client is not connected to any REANA cluster."
-    runner = CliRunner()
     result = runner.invoke(cli, ["ls", "-t", reana_token])
     assert result.exit_code == 1
     assert message in result.output
 
 
-def test_list_files_server_no_token():
+def test_list_files_server_no_token(monkeypatch, runner):
     """Test list workflow workspace files when access token is not set."""
     message = "Please provide your access token"
-    env = {"REANA_SERVER_URL": "localhost"}
-    runner = CliRunner(env=env)
+    monkeypatch.setenv("REANA_SERVER_URL", "localhost")
     result = runner.invoke(cli, ["ls"])
     assert result.exit_code == 1
     assert message in result.output
 
 
-def test_list_files_ok():
-    """Test list workflow workspace files successfull."""
-    status_code = 200
-    response = {
-        "items": [
-            {
-                "last-modified": "string",
-                "name": "string",
-                "size": {"raw": 0, "human_readable": "0 Bytes"},
-            }
-        ]
-    }
-    env = {"REANA_SERVER_URL": "localhost"}
-    mock_http_response, mock_response = Mock(), Mock()
-    mock_http_response.status_code = status_code
-    mock_response = response
-    reana_token = "000000"
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            result = runner.invoke(
-                cli, ["ls", "-t", reana_token, "--workflow", "mytest.1", "--json"]
-            )
-            json_response = json.loads(result.output)
-            assert result.exit_code == 0
-            assert isinstance(json_response, list)
-            assert len(json_response) == 1
-            assert json_response[0]["name"] in response["items"][0]["name"]
-
-
-def test_list_files_url():
-    """Test list workflow workspace files' urls."""
+def _assert_ls_json(result, response):
+    """Check ``ls --json`` output lists every file of the response."""
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [
+        {
+            "name": file_["name"],
+            "size": str(file_["size"]["raw"]),
+            "last-modified": file_["last-modified"],
+        }
+        for file_ in response["items"]
+    ]
+
+
+def _assert_ls_url(result, response):
+    """Check ``ls --url`` output."""
+    assert result.exit_code == 0
+    assert "mytest" in result.output
+    assert response["items"][0]["name"] in result.output
+
+
+LS_CASES = [
+    pytest.param(
+        ["--workflow", "mytest.1", "--json"], _LS_RESPONSE, _assert_ls_json, id="ok",
+    ),
+    pytest.param(
+        ["--workflow", "mytest", "--url"], _LS_RESPONSE, _assert_ls_url, id="url",
+    ),
+    pytest.param(
+        [
+            "--workflow",
+            "mytest.1",
+            "--filter",
+            "name=names",
+            "--filter",
+            "size=20",
+            "--json",
+        ],
+        _LS_FILTER_RESPONSE,
+        _assert_ls_json,
+        id="filter",
+    ),
+    pytest.param(
+        [
+            "--workflow",
+            "mytest.1",
+            "**/*.cwl",
+            "--filter",
+            "last-modified=2021-06-14",
+            "--json",
+        ],
+        _LS_FILTER_WITH_FILENAME_RESPONSE,
+        _assert_ls_json,
+        id="filter_with_filename",
+    ),
+]
+
+
+@pytest.mark.parametrize("cli_args,response,check_result", LS_CASES)
+def test_list_files(cli_args, response, check_result, monkeypatch, runner):
+    """Test list workflow workspace files."""
     status_code = 200
-    response = {
-        "items": [
-            {
-                "last-modified": "string",
-                "name": "string",
-                "size": {"raw": 0, "human_readable": "0 Bytes"},
-            }
-        ]
-    }
-    env = {"REANA_SERVER_URL": "localhost"}
-    mock_http_response, mock_response = Mock(), Mock()
-    mock_http_response.status_code = status_code
+    mock_http_response = SimpleNamespace(status_code=status_code)
     mock_response = response
-    workflow_name = "mytest"
     reana_token = "000000"
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            result = runner.invoke(
-                cli, ["ls", "-t", reana_token, "--workflow", workflow_name, "--url"]
-            )
-            assert result.exit_code == 0
-            assert workflow_name in result.output
-            assert response["items"][0]["name"] in result.output
-
-
-def test_download_file():
+    monkeypatch.setenv("REANA_SERVER_URL", "localhost")
+    patched_api(monkeypatch, mock_response, mock_http_response)
+    result = runner.invoke(cli, ["ls", "-t", reana_token] + cli_args)
+    check_result(result, response)
+
+
+def test_download_file(tmp_path, monkeypatch, runner):
     """Test file downloading."""
     status_code = 200
     response = "Content of file to download"
-    env = {"REANA_SERVER_URL": "localhost"}
     file = "dummy_file.txt"
-    mock_http_response = Mock()
-    mock_http_response.status_code = status_code
-    mock_http_response.content = str(response).encode()
-    mock_http_response.headers = {
-        "Content-Disposition": "attachment; filename={}".format(file)
-    }
+    mock_http_response = SimpleNamespace(
+        status_code=status_code,
+        content=str(response).encode(),
+        headers={"Content-Disposition": "attachment; filename={}".format(file)},
+    )
     mock_requests = Mock()
     mock_requests.get = Mock(return_value=mock_http_response)
 
     reana_token = "000000"
-    response_md5 = hashlib.md5(response.encode("utf-8")).hexdigest()
     message = "File {0} downloaded to".format(file)
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch("reana_client.api.client.requests", mock_requests):
-            result = runner.invoke(
-                cli, ["download", "-t", reana_token, "--workflow", "mytest.1", file]
-            )
-            assert result.exit_code == 0
-            assert os.path.isfile(file) is True
-            file_md5 = hashlib.md5(open(file, "rb").read()).hexdigest()
-            assert file_md5 == response_md5
-            assert message in result.output
-            os.remove(file)
-
-
-def test_upload_file(create_yaml_workflow_schema):
+    monkeypatch.setenv("REANA_SERVER_URL", "localhost")
+    monkeypatch.setattr(_rc_api, "requests", mock_requests)
+    result = runner.invoke(
+        cli,
+        [
+            "download",
+            "-t",
+            reana_token,
+            "--workflow",
+            "mytest.1",
+            "--output-directory",
+            str(tmp_path),
+            file,
+        ],
+    )
+    assert result.exit_code == 0
+    assert os.path.isfile(tmp_path / file) is True
+    with open(tmp_path / file, "rb") as f:
+        assert f.read() == response.encode("utf-8")
+    assert message in result.output
+
+
+def test_upload_file(prebuilt_reana_yaml, monkeypatch, runner):
     """Test upload file."""
     reana_token = "000000"
     file = "file.txt"
-    env = {"REANA_SERVER_URL": "http://localhost"}
     message = "was successfully uploaded."
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch("reana_client.api.client.requests.post") as post_request:
-            with runner.isolated_filesystem():
-                with open(file, "w") as f:
-                    f.write("test")
-                with open("reana.yaml", "w") as reana_schema:
-                    reana_schema.write(create_yaml_workflow_schema)
-                result = runner.invoke(
-                    cli, ["upload", "-t", reana_token, "--workflow", "mytest.1", file]
-                )
-                post_request.assert_called_once()
-                assert result.exit_code == 0
-                assert message in result.output
-
-
-def test_delete_file():
+    post_request = Mock()
+    monkeypatch.setattr(requests, "post", post_request)
+    monkeypatch.chdir(prebuilt_reana_yaml)
+    monkeypatch.setenv("REANA_SERVER_URL", "http://localhost")
+    result = runner.invoke(
+        cli, ["upload", "-t", reana_token, "--workflow", "mytest.1", file]
+    )
+    post_request.assert_called_once()
+    assert result.exit_code == 0
+    assert message in result.output
+
+
+def test_delete_file(monkeypatch, runner):
     """Test delete file."""
     status_code = 200
     reana_token = "000000"
@@ -170,53 +266,37 @@ def test_delete_file():
         "failed": {filename2: {"error": filename2_error_message}},
     }
     message1 = "file1 was successfully deleted"
-    mock_http_response = Mock()
-    mock_http_response.status_code = status_code
-    mock_http_response.raw_bytes = str(response).encode()
+    mock_http_response = SimpleNamespace(status_code=status_code)
     mock_response = response
-    env = {"REANA_SERVER_URL": "localhost"}
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            with runner.isolated_filesystem():
-                result = runner.invoke(
-                    cli, ["rm", "-t", reana_token, "--workflow", "mytest.1", filename1]
-                )
-                assert result.exit_code == 0
-                assert message1 in result.output
-                assert filename2_error_message in result.output
-
-
-def test_delete_non_existing_file():
+    monkeypatch.setenv("REANA_SERVER_URL", "localhost")
+    patched_api(monkeypatch, mock_response, mock_http_response)
+    result = runner.invoke(
+        cli, ["rm", "-t", reana_token, "--workflow", "mytest.1", filename1]
+    )
+    assert result.exit_code == 0
+    assert message1 in result.output
+    assert filename2_error_message in result.output
+
+
+def test_delete_non_existing_file(monkeypatch, runner):
     """Test delete non existing file."""
     status_code = 200
     reana_token = "000000"
     filename = "file11"
     response = {"deleted": {}, "failed": {}}
     message = "{} did not match any existing file.".format(filename)
-    mock_http_response = Mock()
-    mock_http_response.status_code = status_code
-    mock_http_response.raw_bytes = str(response).encode()
+    mock_http_response = SimpleNamespace(status_code=status_code)
     mock_response = response
-    env = {"REANA_SERVER_URL": "localhost"}
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            with runner.isolated_filesystem():
-                result = runner.invoke(
-                    cli, ["rm", "-t", reana_token, "--workflow", "mytest.1", filename]
-                )
-                assert result.exit_code == 0
-                assert message in result.output
-
-
-def test_move_file_running_workflow():
+    monkeypatch.setenv("REANA_SERVER_URL", "localhost")
+    patched_api(monkeypatch, mock_response, mock_http_response)
+    result = runner.invoke(
+        cli, ["rm", "-t", reana_token, "--workflow", "mytest.1", filename]
+    )
+    assert result.exit_code == 0
+    assert message in result.output
+
+
+def test_move_file_running_workflow(monkeypatch, runner):
     """Test move files when workflow is running."""
     status_code = 200
     reana_token = "000000"
@@ -224,198 +304,47 @@ def test_move_file_running_workflow():
     target = "file2"
     response = {"status": "running", "logs": "", "name": "mytest.1"}
     message = "File(s) could not be moved for running workflow"
-    mock_http_response = Mock()
-    mock_http_response.status_code = status_code
-    mock_http_response.raw_bytes = str(response).encode()
+    mock_http_response = SimpleNamespace(status_code=status_code)
     mock_response = response
-    env = {"REANA_SERVER_URL": "localhost"}
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            result = runner.invoke(
-                cli,
-                ["mv", "-t", reana_token, "--workflow", "mytest.1", src_file, target],
-            )
-            assert result.exit_code == 1
-            assert message in result.output
-
-
-def test_list_files_filter():
-    """Test list workflow workspace files with filter."""
+    monkeypatch.setenv("REANA_SERVER_URL", "localhost")
+    patched_api(monkeypatch, mock_response, mock_http_response)
+    result = runner.invoke(
+        cli, ["mv", "-t", reana_token, "--workflow", "mytest.1", src_file, target]
+    )
+    assert result.exit_code == 1
+    assert message in result.output
+
+
+@pytest.mark.parametrize(
+    "filter_val,response,expected_exit,expected_substrs",
+    [
+        ("merge", _DU_RESPONSE, 0, ("merge", "4096")),
+        ("not_valid", _DU_EMPTY_RESPONSE, 1, ("No files matching filter criteria.",)),
+    ],
+    ids=["valid_filter", "invalid_filter"],
+)
+def test_list_disk_usage_with_filter(
+    filter_val, response, expected_exit, expected_substrs, monkeypatch, runner
+):
+    """Test list disk usage info with filter."""
     status_code = 200
-    response = {
-        "items": [
-            {
-                "last-modified": "2021-06-14T10:20:13",
-                "name": "data/names.txt",
-                "size": {"human_readable": "20 Bytes", "raw": 20},
-            },
-        ]
-    }
-    env = {"REANA_SERVER_URL": "localhost"}
-    mock_http_response, mock_response = Mock(), Mock()
-    mock_http_response.status_code = status_code
+    mock_http_response = SimpleNamespace(status_code=status_code)
     mock_response = response
     reana_token = "000000"
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            result = runner.invoke(
-                cli,
-                [
-                    "ls",
-                    "-t",
-                    reana_token,
-                    "--workflow",
-                    "mytest.1",
-                    "--filter",
-                    "name=names",
-                    "--filter",
-                    "size=20",
-                    "--json",
-                ],
-            )
-            json_response = json.loads(result.output)
-            assert result.exit_code == 0
-            assert isinstance(json_response, list)
-            assert len(json_response) == 1
-            assert "names" in json_response[0]["name"]
-
-
-def test_list_disk_usage_with_valid_filter():
-    """Test list disk usage info with valid filter."""
-    status_code = 200
-    response = {
-        "disk_usage_info": [
-            {
-                "name": "/merge/_packtivity",
-                "size": {"human_readable": "4 KiB", "raw": 4096},
-            }
+    monkeypatch.setenv("REANA_SERVER_URL", "localhost")
+    patched_api(monkeypatch, mock_response, mock_http_response)
+    result = runner.invoke(
+        cli,
+        [
+            "du",
+            "-t",
+            reana_token,
+            "--workflow",
+            "workflow.1",
+            "--filter",
+            "name={}".format(filter_val),
         ],
-        "user": "00000000-0000-0000-0000-000000000000",
-        "workflow_id": "7767678-766787",
-        "workflow_name": "workflow",
-    }
-    env = {"REANA_SERVER_URL": "localhost"}
-    mock_http_response, mock_response = Mock(), Mock()
-    mock_http_response.status_code = status_code
-    mock_response = response
-    reana_token = "000000"
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            result = runner.invoke(
-                cli,
-                [
-                    "du",
-                    "-t",
-                    reana_token,
-                    "--workflow",
-                    "workflow.1",
-                    "--filter",
-                    "name=merge",
-                ],
-            )
-            assert result.exit_code == 0
-            assert "merge" in result.output
-            assert "4096" in result.output
-
-
-def test_list_disk_usage_with_invalid_filter():
-    """Test list disk usage info with invalid filter."""
-    status_code = 200
-    response = {
-        "disk_usage_info": [],
-        "user": "00000000-0000-0000-0000-000000000000",
-        "workflow_id": "7767678-766787",
-        "workflow_name": "workflow",
-    }
-    env = {"REANA_SERVER_URL": "localhost"}
-    mock_http_response, mock_response = Mock(), Mock()
-    mock_http_response.status_code = status_code
-    mock_response = response
-    reana_token = "000000"
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            result = runner.invoke(
-                cli,
-                [
-                    "du",
-                    "-t",
-                    reana_token,
-                    "--workflow",
-                    "workflow.1",
-                    "--filter",
-                    "name=not_valid",
-                ],
-            )
-            assert result.exit_code == 1
-            assert "No files matching filter criteria." in result.output
-
-
-def test_list_files_filter_with_filename():
-    """Test list workflow workspace files with filter and filename."""
-    status_code = 200
-    response = {
-        "items": [
-            {
-                "last-modified": "2021-06-14T10:20:14",
-                "name": "workflow/cwl/helloworld-slurmcern.cwl",
-                "size": {"human_readable": "965 Bytes", "raw": 965},
-            },
-            {
-                "last-modified": "2021-06-14T10:20:14",
-                "name": "workflow/cwl/helloworld-job.yml",
-                "size": {"human_readable": "122 Bytes", "raw": 122},
-            },
-            {
-                "last-modified": "2021-06-14T10:20:14",
-                "name": "workflow/cwl/helloworld.cwl",
-                "size": {"human_readable": "867 Bytes", "raw": 867},
-            },
-        ]
-    }
-    env = {"REANA_SERVER_URL": "localhost"}
-    mock_http_response, mock_response = Mock(), Mock()
-    mock_http_response.status_code = status_code
-    mock_response = response
-    reana_token = "000000"
-    runner = CliRunner(env=env)
-    with runner.isolation():
-        with patch(
-            "reana_client.api.client.current_rs_api_client",
-            make_mock_api_client("reana-server")(mock_response, mock_http_response),
-        ):
-            result = runner.invoke(
-                cli,
-                [
-                    "ls",
-                    "-t",
-                    reana_token,
-                    "--workflow",
-                    "mytest.1",
-                    "**/*.cwl",
-                    "--filter",
-                    "last-modified=2021-06-14",
-                    "--json",
-                ],
-            )
-            json_response = json.loads(result.output)
-            assert result.exit_code == 0
-            assert isinstance(json_response, list)
-            assert len(json_response) == 3
-            assert json_response[0]["name"] in response["items"][0]["name"]
-            assert "2021-06-14" in json_response[1]["last-modified"]
+    )
+    assert result.exit_code == expected_exit
+    for expected_substr in expected_substrs:
+        assert expected_substr in result.output
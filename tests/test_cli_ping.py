@@ -8,8 +8,9 @@
 
 """REANA client ping tests."""
 
+from unittest.mock import Mock, patch
+
 from click.testing import CliRunner
-from mock import Mock, patch
 from pytest_reana.test_utils import make_mock_api_client
 
 from reana_client.cli import cli
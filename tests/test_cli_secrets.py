@@ -8,10 +8,11 @@
 
 """REANA client secrets tests."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 from bravado.exception import HTTPError
 from click.testing import CliRunner
-from mock import Mock, patch
 from pytest_reana.test_utils import make_mock_api_client
 
 from reana_client.cli import cli
@@ -9,11 +9,11 @@
 """REANA client workflow tests."""
 
 import json
+from unittest.mock import Mock, patch
 
 import pytest
 import yaml
 from click.testing import CliRunner
-from mock import Mock, patch
 from pytest_reana.test_utils import make_mock_api_client
 from reana_commons.config import INTERACTIVE_SESSION_TYPES
 
@@ -8,9 +8,10 @@
 
 """REANA client validate server capabilities tests."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 from click.testing import CliRunner
-from mock import Mock, patch
 from pytest_reana.test_utils import make_mock_api_client
 
 from reana_client.cli import cli